@@ -1,17 +1,24 @@
 #!/usr/bin/env python3
 
 import os
+import csv
 import math
+import shutil
 import argparse
+import threading
 import subprocess as sub
 
+import numpy as np
+
 from sys import stderr, exit
-from datetime import timedelta
-from tempfile import mkdtemp
-from threading import Semaphore, Thread, Lock
+from bisect import bisect_left
+from zipfile import BadZipFile
+from tempfile import mkdtemp, mkstemp
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 MAJOR, MINOR, PATCH = 0, 1, 1
 VERSION = f'{MAJOR}.{MINOR}.{PATCH}'
+PIPE_BUFFER_SIZE = 1 << 20  # for reading ffprobe output
 
 class EmptyConfig:
     """Helper placeholder class
@@ -20,9 +27,30 @@ class EmptyConfig:
         return None
 
 
-def get_levels_in_time(probe_process: sub.Popen):
-    for line in probe_process.stdout:
-        yield map(float, line.decode().strip().split(','))
+def read_levels(probe_process: sub.Popen):
+    """Reads the ffprobe output block by block
+    and returns arrays of timestamps and volumes
+
+    Raises ValueError unless every line holds a timestamp and a volume.
+    """
+    parsed, rest = [], b''
+    while True:
+        block = probe_process.stdout.read(PIPE_BUFFER_SIZE)
+        data = rest + block
+        if block:
+            # parse whole lines only, the rest goes with the next block
+            cut = data.rfind(b'\n') + 1
+            data, rest = data[:cut], data[cut:]
+        elif data and not data.endswith(b'\n'):
+            data += b'\n'
+        if data.count(b',') != data.count(b'\n'):
+            raise ValueError('expected "timestamp,volume" lines from ffprobe')
+        # one comma-separated stream of numbers parses without per-line work
+        parsed.append(np.fromstring(data.replace(b'\n', b','), sep=','))
+        if not block:
+            break
+    levels = np.concatenate(parsed).reshape(-1, 2)
+    return levels[:, 0], levels[:, 1]
 
 
 class AutoCut:
@@ -34,7 +62,9 @@ class AutoCut:
         config           -- namespace of an argument parser
         """
         self.check_utilities('ffmpeg', 'ffprobe')
-        if not os.path.exists(input_file):
+        try:
+            self._stat = os.stat(input_file)
+        except FileNotFoundError:
             print('error: file does not exist', file=stderr)
             exit(1)
         self.config = config if config else EmptyConfig()
@@ -42,6 +72,9 @@ class AutoCut:
         input_base, extension = os.path.splitext(self.input_file)
         self.output_base = output_base_name if output_base_name else input_base
         self.extension = extension
+        self._stream = None  # index and sample rate of the audio stream
+        self._stream_lock = threading.Lock()
+        self._levels = None  # future of a prefetched analysis
 
     def run_montage(self, rms_threshold: float):
         """Executes the segmentation and audio analysis
@@ -49,60 +82,181 @@ class AutoCut:
         rms_threshold -- Maximum RootMeansSquare threshold level of noise
         """
         segments = self.audio_level_segmentation(rms_threshold)
-        if not segments:
+        if len(segments) == 0:
             print(f'warning: no cuts received', file=stderr)
             return
         temp_dir = mkdtemp(
             prefix=f'autocut_{self.output_base}_',
             dir=os.getcwd())
         print(f'created clips directory: {temp_dir}')
-        logn = math.ceil(math.log(len(segments) - 1, 10))  # max width of index
+        logn = len(str(len(segments)))  # max width of index
         segments_path = os.path.join(temp_dir, 'segments.txt')
-        count_guard, count = Lock(), 0
-
-        def create_clip(segments_file, lock):
-            nonlocal count
-            file_base = f'{self.output_base}.{i+1:0{logn}}{self.extension}'
-            output_file = os.path.join(temp_dir, file_base)
-            success = True
-            if not self.config.dry_run:
-                success = self.slice_and_copy(start, end, output_file)
-            lock.release()
-            if success:
-                with count_guard:
-                    count += 1
-                    print(
-                        f'successful: {count} / {len(segments)}',
-                        end='\r',
-                        flush=True)
-                segments_file.write(f'{file_base}: {start, end}\n')
-            else:
-                print(f'\nerror at {start, end}')
-                segments_file.write(f'<no file>: {start, end}\n')
-
+        file_bases = [
+            f'{self.output_base}.{i+1:0{logn}}{self.extension}'
+            for i in range(len(segments))]
+        if self.config.dry_run:
+            clips = file_bases
+        else:
+            clips = self.segment_and_copy(segments, temp_dir, file_bases)
+            if clips is None:
+                print(
+                    'warning: single-pass cutting failed, '
+                    'falling back to one clip at a time',
+                    file=stderr)
+                clips = self.slice_clips(segments, temp_dir, file_bases)
+                print()
+            elif None in clips:
+                missing = [i for i, clip in enumerate(clips) if clip is None]
+                print(
+                    f'warning: {len(missing)} clips overlap or do not fall '
+                    'on keyframes, slicing them one at a time',
+                    file=stderr)
+                sliced = self.slice_clips(
+                    segments[missing],
+                    temp_dir,
+                    [file_bases[i] for i in missing])
+                for i, clip in zip(missing, sliced):
+                    clips[i] = clip
+                print()
+        for (start, end), clip in zip(segments.tolist(), clips):
+            if not clip:
+                print(f'error at {start, end}')
         with open(segments_path, 'w') as segments_file:
-            jobs = []
-            lock = Semaphore(8)
-            for i, (start, end) in enumerate(segments):
-                t = Thread(target=create_clip, args=(segments_file, lock))
-                lock.acquire()
-                jobs.append(t)
-                t.start()
-            for job in jobs:
-                job.join()
-        print()
+            segments_file.writelines(
+                f'{clip or "<no file>"}: {start, end}\n'
+                for (start, end), clip in zip(segments.tolist(), clips))
+        count = sum(1 for clip in clips if clip)
+        print(f'successful: {count} / {len(segments)}')
 
         if self.config.dry_run and self.config.verbose:
             with open(segments_path, 'r') as segments_file:
                 print('-' * 12)
                 print(f'{segments_path}\n')
                 print(segments_file.read())
-        try:
-            if self.config.dry_run:
-                os.remove(segments_path)
+        if self.config.dry_run:
+            # nothing but segments.txt was created
+            os.remove(segments_path)
             os.rmdir(temp_dir)
-        except:
-            pass
+
+    def segment_and_copy(self, segments, output_dir, file_bases):
+        """Cuts all sections out of the input file
+        in a single pass of the segment muxer
+
+        segments   -- array of (start, end) sections
+        output_dir -- directory to create the clips in
+        file_bases -- file names of the clips, one per section
+
+        Returns the file name of each clip, None for the sections which
+        overlap the previous one or whose boundaries the muxer could not
+        cut at, or None if it failed.
+        """
+        # the muxer splits the whole input, the gaps between
+        # the sections are cut as well and removed afterwards
+        times, owners = [], {}
+        for i, (start, end) in enumerate(segments):
+            if times and start < times[-1]:
+                continue  # a piece cannot overlap the previous one
+            if start > (times[-1] if times else 0):
+                times.append(start)
+            owners[len(times)] = i  # index of the piece starting at `start`
+            times.append(end)
+        piece_prefix = '.autocut_piece_'
+        pieces_path = os.path.join(output_dir, f'{piece_prefix}list.csv')
+        output_pattern = os.path.join(output_dir, piece_prefix).replace(
+            '%', '%%') + '%06d' + self.extension.replace('%', '%%')
+        args = [
+            'ffmpeg',
+            '-nostdin',
+            '-hide_banner',
+            '-loglevel',
+            'error',
+            '-i',
+            self.input_file,
+            '-c',
+            'copy',
+            '-f',
+            'segment',
+            '-segment_times',
+            ','.join(f'{time:.3f}' for time in times),
+            '-reset_timestamps',
+            '1',
+            '-segment_list',
+            pieces_path,
+            '-segment_list_type',
+            'csv',
+            output_pattern
+        ]
+        try:
+            edit_process = sub.Popen(
+                args,
+                stdout=sub.DEVNULL,
+                stderr=sub.DEVNULL)
+            failed = edit_process.wait() != 0
+        except OSError:
+            # e.g. too many boundaries for a single argument
+            failed = True
+        if failed:
+            for name in os.listdir(output_dir):
+                if name.startswith(piece_prefix):
+                    os.remove(os.path.join(output_dir, name))
+            return None
+        # with stream copy the muxer can only split at keyframes, so keep
+        # the pieces which start and end at the requested boundaries only
+        bounds = [0] + times
+        tolerance = 0.1  # seconds
+        clips = [None] * len(segments)
+        with open(pieces_path, newline='') as pieces_file:
+            for name, piece_start, piece_end in csv.reader(pieces_file):
+                piece_path = os.path.join(output_dir, os.path.basename(name))
+                piece_start, piece_end = float(piece_start), float(piece_end)
+                # boundaries may lie closer than the tolerance to each
+                # other, take the nearest one
+                p = bisect_left(bounds, piece_start)
+                if p == len(bounds) or (
+                        p > 0 and piece_start - bounds[p - 1]
+                        <= bounds[p] - piece_start):
+                    p -= 1
+                i = owners.get(p)
+                if (i is None or clips[i]
+                        or abs(bounds[p] - piece_start) > tolerance
+                        or abs(bounds[p + 1] - piece_end) > tolerance):
+                    os.remove(piece_path)
+                    continue
+                os.replace(piece_path, os.path.join(output_dir, file_bases[i]))
+                clips[i] = file_bases[i]
+        os.remove(pieces_path)
+        return clips
+
+    def slice_clips(self, segments, output_dir, file_bases):
+        """Slices the sections one by one
+        with several ffmpeg processes at a time
+
+        segments   -- array of (start, end) sections
+        output_dir -- directory to create the clips in
+        file_bases -- file names of the clips, one per section
+        """
+        clips = [None] * len(segments)
+        count = 0
+        workers = self.config.jobs or min(16, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    self.slice_and_copy,
+                    start,
+                    end,
+                    os.path.join(output_dir, file_base)): i
+                for i, ((start, end), file_base)
+                in enumerate(zip(segments, file_bases))}
+            for future in as_completed(futures):
+                i = futures[future]
+                if future.result():
+                    clips[i] = file_bases[i]
+                    count += 1
+                    print(
+                        f'successful: {count} / {len(segments)}',
+                        end='\r',
+                        flush=True)
+        return clips
 
     def slice_and_copy(self, start: float, end: float, output_file):
         """Slices the input file at a section
@@ -112,73 +266,98 @@ class AutoCut:
         end         -- end of a section
         output_file -- file name to create a copy with
         """
+        # seeking before the input jumps right to the section
+        # instead of reading the input from its beginning
         args = [
             'ffmpeg',
+            '-nostdin',
+            '-hide_banner',
+            '-loglevel',
+            'error',
+            '-ss',
+            f'{start:.3f}',
             '-i',
             self.input_file,
+            '-t',
+            f'{end - start:.3f}',
             '-c',
             'copy',
-            '-ss',
-            f'{timedelta(seconds=start)}',
-            '-to',
-            f'{timedelta(seconds=end)}',
+            '-avoid_negative_ts',
+            'make_zero',
             output_file
         ]
-        edit_process = sub.Popen(args, stdout=sub.PIPE, stderr=sub.PIPE)
-        out, err = edit_process.communicate()
-        # print(f'process stdout: {out.decode()}')
-        # print(f'process stderr: {err.decode()}')
-        return edit_process.returncode == 0
+        edit_process = sub.Popen(args, stdout=sub.DEVNULL, stderr=sub.DEVNULL)
+        return edit_process.wait() == 0
+
+    def prefetch_levels(self):
+        """Starts the audio analysis in the background,
+        e.g. to overlap it with the noise scan
+        """
+        levels = Future()
+
+        def load():
+            try:
+                levels.set_result(self._load_levels())
+            except BaseException as e:
+                levels.set_exception(e)
+
+        # an executor thread is joined at exit, a daemon thread
+        # lets an interrupted run quit without the whole analysis
+        threading.Thread(target=load, daemon=True).start()
+        self._levels = levels
 
     def audio_level_segmentation(self, threshold: float):
         """Performs audio-level analysis and returns segments
 
         threshold -- Maximum RootMeansSquare threshold level of noise
         """
-        volumes = {}  # for the purpose of averaging
         print(f'analyzing audio of {self.input_file} ...')
-        probe_process = self._probe_rms(
-            self.input_file,
-            stdout=sub.PIPE,
-            stderr=sub.PIPE)
-        for timestamp, volume, *rest in get_levels_in_time(probe_process):
-            average = volumes.setdefault(
-                round(round(timestamp * 10) / 10, 1),
-                [0, 0])
-            average[0] += volume  # sum
-            average[1] += 1  # count
-        out, err = probe_process.communicate()
+        if self._levels:
+            timestamps, volumes = self._levels.result()
+        else:
+            timestamps, volumes = self._load_levels()
+        # average the volumes over buckets of 0.1 second,
+        # a bucket index converts back to seconds with `bucket / 10`
+        buckets = np.maximum(np.rint(timestamps * 10).astype(np.int64), 0)
+        sums = np.bincount(buckets, weights=volumes)
+        counts = np.bincount(buckets)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            levels = np.where(counts > 0, sums / counts, -np.inf)
         print(f'processing cuts -- threshold: {threshold:.2f}...')
-        segments = []
         time_step = 0.1  # seconds
-        begin_time, end_time = None, None
-        loud_count, silent_count = 0, 0
         # TODO: hardcoded values
         loud_needed, silent_needed = 3, 5  # 3 * 0.1 sec and 5 * 0.1 sec
-        recording = False
         margin = 3
-        for timestamp, (acc, count) in volumes.items():
-            current = acc / count
-            if self.config.trace_rms:
-                print(f'trace: {timestamp}: {current}')
-            if abs(current) != math.inf and int(current) > threshold:
-                loud_count += 1
-                silent_count = 0
-            else:
-                silent_count += 1
-                loud_count = 0
-            if not recording and loud_count == loud_needed:
-                begin_time = timestamp - time_step * (loud_needed + margin)
-                recording = True
-            elif recording and silent_count == silent_needed:
-                end_time = timestamp - time_step * (silent_needed - margin)
-                recording = False
-                segments.append((begin_time, end_time))
-
-        if segments and segments[0] and segments[0][0] < 0:
+        if self.config.trace_rms:
+            for bucket, current in enumerate(levels.tolist()):
+                print(f'trace: {bucket / 10}: {current}')
+        loud = np.isfinite(levels) & (np.trunc(levels) > threshold)
+        # split the buckets into alternating runs of loud and silent ones
+        run_starts = np.flatnonzero(np.diff(loud.view(np.int8), prepend=-1))
+        run_lengths = np.diff(np.concatenate((run_starts, [len(loud)])))
+        run_loud = loud[run_starts]
+        # keep the runs long enough to start or to end a segment
+        needed = np.where(run_loud, loud_needed, silent_needed)
+        kept = run_lengths >= needed
+        run_starts, run_loud = run_starts[kept], run_loud[kept]
+        # a segment begins at the first loud run after a silent one
+        # and ends at the first silent run after a loud one
+        after_silent = np.concatenate(([True], ~run_loud))[:-1]
+        begins = run_starts[run_loud & after_silent]
+        ends = run_starts[~run_loud & ~after_silent]
+        begins = begins[:len(ends)]  # drop a segment lasting until the end
+        begin_times = (
+            (begins + loud_needed - 1) / 10
+            - time_step * (loud_needed + margin))
+        end_times = (
+            (ends + silent_needed - 1) / 10
+            - time_step * (silent_needed - margin))
+        segments = np.column_stack((begin_times, end_times))
+
+        if len(segments) != 0 and segments[0, 0] < 0:
             # TODO: this is ugly
             # If feasible, discard the possibility of a negative boundary
-            del segments[0]
+            segments = segments[1:]
         print(f'found {len(segments)} cuts')
         return segments
 
@@ -189,45 +368,22 @@ class AutoCut:
         duration -- sample duration time in seconds
         start    -- starting point for the scan (in seconds)
         """
-        acc, count = 0, 0
-        max_vol, min_vol = -math.inf, math.inf
-        probe_process = self._probe_rms(
-            self.input_file,
-            stdout=sub.PIPE,
-            stderr=sub.PIPE)
+        args, timestamps, volumes = self._probe_levels(start, duration)
+        volumes = volumes[np.isfinite(volumes)]
         # calculate the stats
-        for timestamp, volume, *rest in get_levels_in_time(probe_process):
-            if int(timestamp) > start + duration:
-                break
-            if int(timestamp) < start:
-                # TODO: O(n) to get to the start
-                #       I think it could be O(1)
-                continue
-            max_vol = max(max_vol, volume)
-            if volume != -math.inf:
-                min_vol = min(min_vol, volume)
-                acc += volume
-                count += 1
-        if count != 0:
-            avg_vol = acc / count
+        if len(volumes) != 0:
+            max_vol, min_vol = float(volumes.max()), float(volumes.min())
+            avg_vol = float(volumes.mean())
         else:
+            max_vol, min_vol = -math.inf, math.inf
             avg_vol = math.nan
 
         # find the most stable lower bound
-        prev_vol, smallest_diff = math.inf, math.inf
+        diffs = np.abs(np.diff(volumes))
+        diffs[volumes[1:] >= avg_vol] = np.inf
         stable_volume = math.inf
-        probe_process = self._probe_rms(
-            self.input_file,
-            stdout=sub.PIPE,
-            stderr=sub.PIPE)
-        for timestamp, volume, *rest in get_levels_in_time(probe_process):
-            if int(timestamp) > duration:
-                break
-            if volume != -math.inf:
-                if abs(volume - prev_vol) < smallest_diff and volume < avg_vol:
-                    smallest_diff = abs(volume - prev_vol)
-                    stable_volume = volume
-                prev_vol = volume
+        if len(diffs) != 0 and diffs.min() != np.inf:
+            stable_volume = float(volumes[1:][diffs.argmin()])
         # calculate suggested noise
         suggest_noise = stable_volume - (stable_volume - avg_vol) * 0.3
         return suggest_noise, max_vol, min_vol, avg_vol
@@ -240,30 +396,185 @@ class AutoCut:
         """
         must_exit = False
         for utility in utilities:
-            try:
-                sub.check_call(
-                    [utility, '-h'],
-                    stdout=sub.DEVNULL,
-                    stderr=sub.DEVNULL)
-            except FileNotFoundError:
+            if shutil.which(utility) is None:
                 print(f'error: could not find {utility}', file=stderr)
                 must_exit = True
         if must_exit:
             exit(1)
 
-    def _probe_rms(self, filename, **kwargs):
+    def _load_levels(self):
+        """Probes RMS levels of the whole input file and returns arrays
+        of timestamps and volumes, cached next to the input file
+        """
+        cache_path = f'{self.input_file}.autocut.npz'
+        use_cache = not self.config.no_cache
+        if use_cache and os.path.exists(cache_path):
+            try:
+                with np.load(cache_path) as cache:
+                    # an unchanged file has the same audio stream,
+                    # no need to probe it again to check the arguments
+                    stream = tuple(
+                        int(cache[key]) if cache[key] >= 0 else None
+                        for key in ('stream_index', 'sample_rate'))
+                    known_args = [
+                        self._probe_rms_args(
+                            self.input_file,
+                            all_measures=all_measures,
+                            stream=stream)
+                        for all_measures in (False, True)]
+                    if (cache['mtime'] == self._stat.st_mtime
+                            and cache['size'] == self._stat.st_size
+                            and cache['args'].tolist() in known_args):
+                        return cache['timestamps'], cache['volumes']
+            except (OSError, KeyError, ValueError, EOFError, BadZipFile):
+                print(
+                    f'warning: ignoring broken cache {cache_path}',
+                    file=stderr)
+        args, timestamps, volumes = self._probe_levels()
+        if use_cache and args:
+            # -1 stands for an unknown stream index or sample rate
+            index, sample_rate = (
+                -1 if value is None else value
+                for value in self._audio_stream())
+            try:
+                # write aside and move into place, never leave a partial cache
+                fd, temp_path = mkstemp(
+                    prefix='.autocut_',
+                    suffix='.npz',
+                    dir=os.path.dirname(os.path.abspath(cache_path)))
+                try:
+                    with os.fdopen(fd, 'wb') as cache_file:
+                        np.savez(
+                            cache_file,
+                            timestamps=timestamps,
+                            volumes=volumes,
+                            mtime=self._stat.st_mtime,
+                            size=self._stat.st_size,
+                            stream_index=index,
+                            sample_rate=sample_rate,
+                            args=args)
+                    os.replace(temp_path, cache_path)
+                finally:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+            except OSError:
+                print(
+                    f'warning: could not write cache {cache_path}',
+                    file=stderr)
+        return timestamps, volumes
+
+    def _probe_levels(self, start=0, duration=None):
+        """Probes RMS levels of the input file and returns the ffprobe
+        arguments (None on failure) with arrays of timestamps and volumes
+        """
+        stream = self._audio_stream()
+        # older FFmpeg builds lack the astats options to measure the
+        # RMS level only, retry with all measures if ffprobe fails at once
+        for all_measures in (False, True):
+            args = self._probe_rms_args(
+                self.input_file,
+                start,
+                duration,
+                all_measures,
+                stream)
+            # ffprobe only logs errors, let them reach the terminal
+            probe_process = sub.Popen(
+                args,
+                bufsize=PIPE_BUFFER_SIZE,
+                stdout=sub.PIPE)
+            try:
+                timestamps, volumes = read_levels(probe_process)
+            except ValueError as e:
+                probe_process.kill()
+                probe_process.wait()
+                print(f'warning: {e}', file=stderr)
+                return None, np.empty(0), np.empty(0)
+            if probe_process.wait() == 0:
+                return args, timestamps, volumes
+            if (probe_process.returncode < 0
+                    or len(timestamps) != 0 or all_measures):
+                break  # killed or failed midway, not on the astats options
+            print(
+                'warning: ffprobe failed, retrying with all astats measures',
+                file=stderr)
+        print(
+            'warning: ffprobe failed with exit code '
+            f'{probe_process.returncode}',
+            file=stderr)
+        return None, timestamps, volumes
+
+    def _probe_rms_args(self, filename, start=0, duration=None,
+                        all_measures=False, stream=(None, None)):
+        index, sample_rate = stream
+        source = f'amovie={filename}'
+        if index is not None:
+            # read the stream whose sample rate is known,
+            # amovie picks the "best" audio stream otherwise
+            source += f':si={index}'
+        if duration is not None:
+            # seek to the span and let ffmpeg stop right after it
+            source += f':sp={start},atrim=start={start}:end={start + duration}'
+        if sample_rate:
+            # make every audio frame last 0.1 second, i.e. one bucket
+            source += f',asetnsamples=n={sample_rate // 10}:p=0'
+        measures = ''
+        if not all_measures:
+            measures = ':measure_perchannel=none:measure_overall=RMS_level'
         args = [
             'ffprobe',
+            '-hide_banner',
+            '-loglevel',
+            'error',
             '-f',
             'lavfi',
             '-i',
-            f'amovie={filename},astats=metadata=1:reset=1',
+            f'{source},astats=metadata=1:reset=1{measures}',
             '-show_entries',
             'frame=pkt_pts_time:frame_tags=lavfi.astats.Overall.RMS_level',
             '-of',
             'csv=p=0'
         ]
-        return sub.Popen(args, **kwargs)
+        return args
+
+    def _audio_stream(self):
+        """Returns the index and sample rate of the audio stream,
+        probed once and only when the audio is analyzed
+        """
+        with self._stream_lock:
+            if self._stream is None:
+                self._stream = self._probe_audio_stream(self.input_file)
+            return self._stream
+
+    def _probe_audio_stream(self, filename):
+        args = [
+            'ffprobe',
+            '-hide_banner',
+            '-loglevel',
+            'error',
+            '-select_streams',
+            'a:0',
+            '-show_entries',
+            'stream=index,sample_rate',
+            '-of',
+            'csv=p=0',
+            filename
+        ]
+        probe_process = sub.Popen(args, stdout=sub.PIPE, stderr=sub.DEVNULL)
+        out, err = probe_process.communicate()
+        try:
+            index, sample_rate = out.split()[0].split(b',')[:2]
+            return int(index), int(sample_rate)
+        except (IndexError, ValueError):
+            return None, None
+
+
+def positive_int(value):
+    """Argument type of integers greater than zero
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1: {value}')
+    return number
 
 
 def run_autocut():
@@ -296,6 +607,12 @@ def run_autocut():
         action='store_true',
         dest='scan_noise_only',
         help='scan noise only, skip the rest')
+    parser.add_argument(
+        '-j', '--jobs',
+        type=positive_int,
+        metavar='N',
+        help='number of ffmpeg processes when cutting clips one by one '
+             '(default=twice the number of cores, at most 16)')
     parser.add_argument(
         '-n', '--dry-run',
         action='store_true',
@@ -304,6 +621,10 @@ def run_autocut():
         '-v', '--verbose',
         action='store_true',
         help='provide debug information')
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='do not reuse nor store the audio analysis cache')
     parser.add_argument(
         '--trace-rms',
         action='store_true',
@@ -316,6 +637,9 @@ def run_autocut():
     args = parser.parse_args()
     autocut = AutoCut(args.input_file, config=args)
     if not args.threshold:
+        if not args.scan_noise_only:
+            # the analysis does not depend on the threshold
+            autocut.prefetch_levels()
         print('scanning noise level threshold ...')
         span = args.start_scan, args.start_scan + args.scan_duration
         print(f'sampling time span: {span}')